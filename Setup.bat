@@ -52,12 +52,12 @@ python -m pip install --upgrade pip
 
 
 # — General packages —
-pip install pyautogui
-pip install pyautogui keyboard
+pip install keyboard
 pip install pynput
 pip install vgamepad
-pip install pyautogui pynput vgamepad numpy
-pip install scipy
+pip install pynput vgamepad numpy
+pip install numba
+pip install orjson
 
 
 
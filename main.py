@@ -6,19 +6,91 @@ import math
 import vgamepad as vg
 from pynput import keyboard
 import numpy as np
-from scipy import interpolate
 import platform
 import json
 import os
+from collections import deque
 from pathlib import Path
 import ctypes
 from ctypes import wintypes, Structure, POINTER, byref, c_int, c_uint, c_long, c_ulong, c_short, c_ushort
 
+# Numba is optional; without it the kernels below run as plain Python
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# orjson is optional; it parses the settings file faster than the stdlib
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 # Windows API constants and structures for raw input
 RIDEV_INPUTSINK = 0x00000100
-RID_INPUT = 0x10000003
 RIM_TYPEMOUSE = 0
-WM_INPUT = 0x00FF
+WM_QUIT = 0x0012
+HWND_MESSAGE = -3
+QS_POSTMESSAGE = 0x0008
+QS_RAWINPUT = 0x0400
+PM_REMOVE = 0x0001
+PM_QS_POSTMESSAGE = 0x00980000
+WAIT_FAILED = 0xFFFFFFFF
+RAW_INPUT_WINDOW_CLASS = "MouseToGamepadRawInput"
+
+# Bytes of raw input read per GetRawInputBuffer call; holds a few hundred mouse packets
+RAW_INPUT_BUFFER_SIZE = 16384
+
+# Raw mouse counts to joystick units per point of sensitivity; tweak if needed
+MOUSE_DELTA_SCALE = 0.00005
+
+# Fallback polling recenters the cursor once it strays this many pixels from screen center
+CURSOR_RECENTER_RADIUS = 200
+
+# Joystick readout refresh period (~30 Hz). Display only; the stick itself is driven by
+# the control loop's own timer
+DISPLAY_INTERVAL_MS = 33
+
+# Joystick readout changes smaller than this (under half a pixel) are not redrawn
+DISPLAY_EPSILON = 0.005
+
+# Joystick dot colours, indexed by how many of the squared magnitude thresholds
+# (0.1, 0.5, 0.8 squared) the stick has crossed
+DOT_COLORS = ('#0f0', '#ff0', '#f80', '#f00')
+
+# Axis values closer to center than this snap to rest instead of decaying forever
+AXIS_REST_EPSILON = 1e-4
+
+# Default control loop period (the "Update (ms)" setting). Stick reports go out at most
+# this often no matter how fast the mouse reports; decay and smoothing slider values are
+# per millisecond and get compounded to the period in use
+CONTROL_TICK_MS = 4
+
+# How often pending settings changes are written to disk
+AUTO_SAVE_DELAY_MS = 1500
+
+# Samples in the precomputed response curve lookup table
+CURVE_LUT_SIZE = 1024
+
+# Built-in response curve presets, as control points
+CURVE_PRESETS = {
+    'linear': ((0, 0), (0.25, 0.25), (0.5, 0.5), (0.75, 0.75), (1.0, 1.0)),
+    'aggressive': ((0, 0), (0.25, 0.1), (0.5, 0.3), (0.75, 0.65), (1.0, 1.0)),
+    'precise': ((0, 0), (0.25, 0.35), (0.5, 0.6), (0.75, 0.82), (1.0, 1.0)),
+    's-curve': ((0, 0), (0.25, 0.15), (0.5, 0.5), (0.75, 0.85), (1.0, 1.0)),
+}
+
+# Waitable timer constants for the control loop tick
+CREATE_WAITABLE_TIMER_HIGH_RESOLUTION = 0x00000002
+TIMER_ALL_ACCESS = 0x001F0003
+INFINITE = 0xFFFFFFFF
+THREAD_PRIORITY_ABOVE_NORMAL = 1
 
 class POINT(Structure):
     _fields_ = [("x", c_long), ("y", c_long)]
@@ -26,6 +98,22 @@ class POINT(Structure):
 class RECT(Structure):
     _fields_ = [("left", c_long), ("top", c_long), ("right", c_long), ("bottom", c_long)]
 
+class WNDCLASSEXW(Structure):
+    _fields_ = [
+        ("cbSize", c_uint),
+        ("style", c_uint),
+        ("lpfnWndProc", ctypes.c_void_p),
+        ("cbClsExtra", c_int),
+        ("cbWndExtra", c_int),
+        ("hInstance", wintypes.HINSTANCE),
+        ("hIcon", wintypes.HICON),
+        ("hCursor", wintypes.HANDLE),
+        ("hbrBackground", wintypes.HBRUSH),
+        ("lpszMenuName", wintypes.LPCWSTR),
+        ("lpszClassName", wintypes.LPCWSTR),
+        ("hIconSm", wintypes.HICON)
+    ]
+
 class RAWINPUTDEVICE(Structure):
     _fields_ = [
         ("usUsagePage", c_ushort),
@@ -53,11 +141,127 @@ class RAWMOUSE(Structure):
         ("ulExtraInformation", c_ulong)
     ]
 
-class RAWINPUT(Structure):
-    _fields_ = [
-        ("header", RAWINPUTHEADER),
-        ("mouse", RAWMOUSE)
-    ]
+# Explicit signatures make Numba compile these at import instead of on the first tick.
+# Mouse deltas are passed as float64 and the curve table as a contiguous float32 array
+@njit("float64(float64, float64, float64, float64)", cache=True, fastmath=True)
+def integrate_axis(raw, delta, scale, decay):
+    """Add a scaled mouse delta to an axis, decay it toward center and clamp to [-1, 1]"""
+    raw = (raw + delta * scale) * decay
+    if raw < -1.0:
+        return -1.0
+    if raw > 1.0:
+        return 1.0
+    if -AXIS_REST_EPSILON < raw < AXIS_REST_EPSILON:
+        return 0.0
+    return raw
+
+@njit("float64(float64, float64, float64, float32[::1])", cache=True, fastmath=True)
+def shape_axis(value, deadzone, inv_one_minus_dz, lut):
+    """Apply the deadzone and response curve table to an axis value, keeping its sign"""
+    magnitude = abs(value)
+    if magnitude < deadzone:
+        return 0.0
+    
+    # Linear blend between the two nearest table entries
+    last = len(lut) - 1
+    t = (magnitude - deadzone) * inv_one_minus_dz * last
+    i = int(t)
+    if i >= last:
+        shaped = lut[last]
+    else:
+        lo = lut[i]
+        shaped = lo + (lut[i + 1] - lo) * (t - i)
+    return shaped if value >= 0.0 else -shaped
+
+@njit("UniTuple(float64, 2)(float64, float64, float64, float64, float64, float64, float32[::1], "
+      "float64, float64, float64)", cache=True, fastmath=True)
+def process_axis(raw, delta, scale, decay, deadzone, inv_one_minus_dz, lut, smoothed, smoothing, sign):
+    """Run one axis through a full tick: integrate, shape, orient and smooth.
+    
+    Returns the new raw and smoothed values.
+    """
+    raw = integrate_axis(raw, delta, scale, decay)
+    target = sign * shape_axis(raw, deadzone, inv_one_minus_dz, lut)
+    return raw, smoothed * smoothing + target * (1.0 - smoothing)
+
+@njit("Tuple((float64, float64, float64, float64, int64, int64))(float64, float64, float64, float64, "
+      "float64, float64, float64, float64, float32[::1], float64, float64, float64, float64, float64)",
+      cache=True, fastmath=True)
+def process_stick(raw_x, raw_y, dx, dy, scale, decay, deadzone, inv_one_minus_dz, lut,
+                  smooth_x, smooth_y, smoothing, x_sign, y_sign):
+    """Run both stick axes through a tick and quantize them to vgamepad's int16 range.
+    
+    An axis whose sign is 0 is disabled and held at rest. Returns the new raw and smoothed
+    values followed by the int16 stick report.
+    """
+    if x_sign == 0.0:
+        raw_x = smooth_x = 0.0
+    else:
+        raw_x, smooth_x = process_axis(raw_x, dx, scale, decay, deadzone, inv_one_minus_dz, lut,
+                                       smooth_x, smoothing, x_sign)
+    if y_sign == 0.0:
+        raw_y = smooth_y = 0.0
+    else:
+        raw_y, smooth_y = process_axis(raw_y, dy, scale, decay, deadzone, inv_one_minus_dz, lut,
+                                       smooth_y, smoothing, y_sign)
+    return raw_x, raw_y, smooth_x, smooth_y, round(smooth_x * 32767), round(smooth_y * 32767)
+
+def _pchip_end_slope(h0, h1, d0, d1):
+    """One-sided three-point tangent for a PCHIP endpoint, kept shape-preserving"""
+    m = ((2 * h0 + h1) * d0 - h0 * d1) / (h0 + h1)
+    if np.sign(m) != np.sign(d0):
+        return 0.0
+    if np.sign(d0) != np.sign(d1) and abs(m) > 3 * abs(d0):
+        return 3 * d0
+    return m
+
+def pchip_coefficients(x_points, y_points):
+    """Fit a monotone cubic Hermite (Fritsch-Carlson) curve through the points.
+    
+    Returns the knots and per-segment cubic coefficients (c3, c2, c1, c0) in dt = x - knot.
+    """
+    x = np.asarray(x_points, dtype=np.float64)
+    y = np.asarray(y_points, dtype=np.float64)
+    h = np.diff(x)
+    delta = np.diff(y) / h
+    
+    # Tangents: weighted harmonic mean of the neighbouring secants, flat at local extrema
+    m = np.zeros(len(x))
+    if len(x) == 2:
+        m[:] = delta[0]
+    else:
+        w1 = 2 * h[1:] + h[:-1]
+        w2 = h[1:] + 2 * h[:-1]
+        d0, d1 = delta[:-1], delta[1:]
+        rising = d0 * d1 > 0
+        m[1:-1][rising] = (w1[rising] + w2[rising]) / (w1[rising] / d0[rising] + w2[rising] / d1[rising])
+        m[0] = _pchip_end_slope(h[0], h[1], delta[0], delta[1])
+        m[-1] = _pchip_end_slope(h[-1], h[-2], delta[-1], delta[-2])
+    
+    # Hermite form -> power form per segment, ready for Horner evaluation
+    coeffs = np.empty((len(h), 4))
+    coeffs[:, 0] = (m[:-1] + m[1:] - 2 * delta) / (h * h)
+    coeffs[:, 1] = (3 * delta - 2 * m[:-1] - m[1:]) / h
+    coeffs[:, 2] = m[:-1]
+    coeffs[:, 3] = y[:-1]
+    return x, coeffs
+
+def evaluate_segments(knots, coeffs, xs):
+    """Evaluate per-segment cubic coefficients at xs with Horner's rule"""
+    seg = np.clip(np.searchsorted(knots, xs, side='right') - 1, 0, len(knots) - 2)
+    dt = xs - knots[seg]
+    c = coeffs[seg]
+    return ((c[:, 0] * dt + c[:, 1]) * dt + c[:, 2]) * dt + c[:, 3]
+
+def tick_delta_gain(decay, tick_ms):
+    """Scale for a tick's summed mouse delta so sustained motion settles where 1 ms ticks would.
+    
+    Adding a whole tick of motion and then decaying once by decay ** tick_ms holds the axis
+    lower than adding and decaying every millisecond; this factor undoes the difference.
+    """
+    if tick_ms <= 1 or not 0.0 < decay < 1.0:
+        return 1.0
+    return (1.0 - decay ** tick_ms) / (tick_ms * decay ** (tick_ms - 1) * (1.0 - decay))
 
 class MouseToGamepadGUI:
     def __init__(self, root):
@@ -76,12 +280,19 @@ class MouseToGamepadGUI:
         # Settings file path
         self.settings_file = Path.home() / "mouse_gamepad_settings.json"
         
+        # Settings are written on worker threads; the lock and sequence numbers keep
+        # an older snapshot from overwriting a newer one
+        self.settings_write_lock = threading.Lock()
+        self.settings_save_seq = 0
+        self.settings_written_seq = 0
+        
         # Default settings
         self.default_settings = {
             'sensitivity': 50,
             'decay_rate': 0.85,
             'deadzone': 0.05,
             'smoothing': 0.3,
+            'update_interval': CONTROL_TICK_MS,
             'x_axis_enabled': True,
             'y_axis_enabled': True,
             'invert_x': False,
@@ -109,15 +320,54 @@ class MouseToGamepadGUI:
         # Control variables
         self.running = False
         self.paused = False
+        # Set while not paused; control_loop blocks on it instead of spinning while paused
+        self.resume_event = threading.Event()
+        self.resume_event.set()
         self.sensitivity = tk.DoubleVar()
         self.decay_rate = tk.DoubleVar()
         self.deadzone = tk.DoubleVar()
         self.smoothing = tk.DoubleVar()
+        self.update_interval = tk.IntVar()
         self.x_axis_enabled = tk.BooleanVar()
         self.y_axis_enabled = tk.BooleanVar()
         self.invert_x = tk.BooleanVar()
         self.invert_y = tk.BooleanVar()
         
+        # Plain mirrors of Tk variables read by the control thread; .get() is a Tcl
+        # round-trip and should not be called from outside the Tk thread
+        self._sens_scale = 0.0
+        self._tick_ms = CONTROL_TICK_MS
+        self._decay_f = 0.0
+        self._delta_gain = 1.0
+        self.mirror_variable(self.sensitivity, '_sens_scale', lambda v: v * MOUSE_DELTA_SCALE)
+        self.mirror_variable(self.update_interval, '_tick_ms', lambda v: max(1, v))
+        # Per-millisecond factors compounded to the tick period. Read the interval variable
+        # itself: Tcl runs write traces newest first, so _tick_ms is not yet updated here
+        self.mirror_variable(self.decay_rate, '_decay_f',
+                             lambda v: v ** max(1, self.update_interval.get()),
+                             depends=(self.update_interval,))
+        self.mirror_variable(self.decay_rate, '_delta_gain',
+                             lambda v: tick_delta_gain(v, max(1, self.update_interval.get())),
+                             depends=(self.update_interval,))
+        self._deadzone_f = 0.0
+        self._inv_one_minus_dz = 1.0
+        self._smooth_f = 0.0
+        self.mirror_variable(self.deadzone, '_deadzone_f')
+        self.mirror_variable(self.deadzone, '_inv_one_minus_dz', lambda v: 1.0 / max(1e-6, 1.0 - v))
+        self.mirror_variable(self.smoothing, '_smooth_f',
+                             lambda v: v ** max(1, self.update_interval.get()),
+                             depends=(self.update_interval,))
+        # Axis toggles, kept as the sign applied to the shaped value: 0 for a disabled axis,
+        # negative when inverted, with screen Y (which grows downward) already flipped
+        self._x_sign = 0.0
+        self._y_sign = 0.0
+        self.mirror_variable(self.invert_x, '_x_sign',
+                             lambda v: (-1.0 if v else 1.0) if self.x_axis_enabled.get() else 0.0,
+                             depends=(self.x_axis_enabled,))
+        self.mirror_variable(self.invert_y, '_y_sign',
+                             lambda v: (1.0 if v else -1.0) if self.y_axis_enabled.get() else 0.0,
+                             depends=(self.y_axis_enabled,))
+        
         # Joystick position tracking
         self.joystick_x = 0.0
         self.joystick_y = 0.0
@@ -128,10 +378,19 @@ class MouseToGamepadGUI:
         self.smooth_x = 0.0
         self.smooth_y = 0.0
         
-        # Raw input tracking
-        self.raw_dx = 0
-        self.raw_dy = 0
-        self.raw_input_lock = threading.Lock()
+        # Raw input tracking: the input thread appends (dx, dy) packets, the control loop
+        # drains them once per tick. deque appends/pops are atomic, so neither side locks
+        self.raw_deltas = deque(maxlen=4096)
+        # Set by the input thread when motion is queued; lets an idle control loop sleep
+        self.motion_event = threading.Event()
+        
+        # Reusable GetRawInputBuffer target; 64-bit elements keep records pointer-aligned
+        self.raw_input_buffer = (ctypes.c_uint64 * (RAW_INPUT_BUFFER_SIZE // 8))()
+        self.raw_input_size = c_uint()
+        self.raw_input_wow64 = False
+        self.get_raw_input_buffer = ctypes.windll.user32.GetRawInputBuffer
+        self.get_raw_input_buffer.restype = c_int  # (UINT)-1 on error
+        self.get_raw_input_buffer.argtypes = [ctypes.c_void_p, POINTER(c_uint), c_uint]
         
         # Cursor lock state
         self.cursor_locked = False
@@ -143,16 +402,49 @@ class MouseToGamepadGUI:
         self.screen_h = user32.GetSystemMetrics(1)
         self.center_x = self.screen_w // 2
         self.center_y = self.screen_h // 2
+        # 1x1 ClipCursor rectangle at screen center, reused by every lock
+        self.lock_rect = RECT(self.center_x, self.center_y, self.center_x + 1, self.center_y + 1)
+        
+        # Fallback cursor polling state (used when raw input / cursor lock is unavailable)
+        self.cursor_pos = POINT()
+        # Bound once so each poll skips the windll lookups and the byref() call
+        self.cursor_pos_ref = byref(self.cursor_pos)
+        self.get_cursor_pos = user32.GetCursorPos
+        self.get_cursor_pos.argtypes = [POINTER(POINT)]
+        self.get_cursor_pos.restype = wintypes.BOOL
+        self.set_cursor_pos = user32.SetCursorPos
+        self.set_cursor_pos.argtypes = [c_int, c_int]
+        self.set_cursor_pos.restype = wintypes.BOOL
+        user32.ClipCursor.argtypes = [POINTER(RECT)]
+        user32.ClipCursor.restype = wintypes.BOOL
+        self.last_mx = self.center_x
+        self.last_my = self.center_y
+        self.recenter_radius_sq = CURSOR_RECENTER_RADIUS * CURSOR_RECENTER_RADIUS
         
         # Response curve control points
         self.control_points = []
+        # Index of the fixed right endpoint; refreshed by update_spline when the points change
+        self.last_point_index = -1
         self.selected_point = None
-        self.spline = None
-        
-        # Keep references for window proc subclassing (prevent GC)
-        self.new_wndproc = None
-        self.original_wndproc = None
-        self._wndproc_ref = None
+        # Response curve sampled on [0, 1]; rebuilt only when the control points change
+        self.curve_lut_xs = np.linspace(0.0, 1.0, CURVE_LUT_SIZE)
+        # Identity until the first spline is built, so the control loop can always shape
+        self.curve_lut = self.curve_lut_xs.astype(np.float32)
+        self.curve_lut_values = self.curve_lut.tolist()
+        self.curve_redraw_pending = False
+        self.curve_spline_stale = False
+        # Curve table per preset, filled on first use: (lut, lut_values)
+        self.preset_curves = {}
+        
+        # Joystick readout last drawn by update_display
+        self.displayed_joystick = None
+        self.x_label_text = None
+        self.y_label_text = None
+        
+        # Raw input message-only window and the thread that drains it
+        self.raw_input_thread = None
+        self.raw_input_thread_id = None
+        self.raw_input_hwnd = None
         
         # Load settings first
         self.load_settings()
@@ -169,80 +461,155 @@ class MouseToGamepadGUI:
         # Keyboard listener
         self.keyboard_listener = None
         
-        # Auto-save timer
-        self.auto_save_after_id = None
+        # Hotkey character -> action, dispatched onto the Tk thread
+        self.hotkey_actions = {
+            '`': self.toggle_pause,
+            '[': lambda: self.adjust_sensitivity(-2),
+            ']': lambda: self.adjust_sensitivity(2),
+        }
+        # Actions queued by the listener thread, run in one batch on the Tk thread
+        self.key_actions = deque()
+        self.key_drain_pending = False
+        
+        # Auto-save: changes only mark the settings dirty; one repeating timer writes them
+        self.settings_dirty = False
+        self.root.after(AUTO_SAVE_DELAY_MS, self.run_auto_save)
         
         # Raw input setup
         if self.cursor_lock_supported:
             self.setup_raw_input()
     
+    def mirror_variable(self, var, attr, transform=None, depends=()):
+        """Keep a plain attribute in sync with a Tk variable through a write trace.
+        
+        The attribute is also recomputed when any variable in depends is written.
+        """
+        def sync(*_):
+            try:
+                value = transform(var.get()) if transform else var.get()
+            except tk.TclError:
+                return
+            setattr(self, attr, value)
+        var.trace_add('write', sync)
+        for other in depends:
+            other.trace_add('write', sync)
+        sync()
+    
     def setup_raw_input(self):
-        """Setup raw input device registration for mouse and subclass window proc to receive WM_INPUT"""
+        """Start a dedicated thread that reads raw mouse input for a message-only window"""
+        self.raw_input_ready = threading.Event()
+        self.raw_input_thread = threading.Thread(target=self.raw_input_loop, daemon=True)
+        self.raw_input_thread.start()
+        
+        # Wait for registration so cursor_lock_supported is settled before START is pressed
+        self.raw_input_ready.wait(1.0)
+        
+        # Hook focus events (kept from original)
+        self.root.bind('<FocusIn>', self.on_focus_in)
+        self.root.bind('<FocusOut>', self.on_focus_out)
+    
+    def raw_input_loop(self):
+        """Own a message-only window and drain its raw input in batches, off the Tk thread"""
+        user32 = ctypes.windll.user32
+        kernel32 = ctypes.windll.kernel32
+        hinstance = None
+        hwnd = None
         try:
-            # Get window handle
-            self.hwnd = self.root.winfo_id()
+            # set argtypes/restype for safer calls with pointer-sized handles
+            CreateWindowExW = user32.CreateWindowExW
+            CreateWindowExW.restype = wintypes.HWND
+            CreateWindowExW.argtypes = [wintypes.DWORD, wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.DWORD,
+                                        c_int, c_int, c_int, c_int, wintypes.HWND, wintypes.HMENU,
+                                        wintypes.HINSTANCE, wintypes.LPVOID]
+            
+            kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+            
+            user32.MsgWaitForMultipleObjects.argtypes = [wintypes.DWORD, ctypes.c_void_p, wintypes.BOOL,
+                                                         wintypes.DWORD, wintypes.DWORD]
+            user32.GetQueueStatus.restype = wintypes.DWORD
+            user32.GetQueueStatus.argtypes = [c_uint]
+            user32.PeekMessageW.restype = wintypes.BOOL
+            user32.PeekMessageW.argtypes = [POINTER(wintypes.MSG), wintypes.HWND, c_uint, c_uint, c_uint]
+            
+            # Input is read with GetRawInputBuffer rather than dispatched as WM_INPUT, so the
+            # window needs no Python callback; the default procedure handles everything else
+            hinstance = kernel32.GetModuleHandleW(None)
+            wc = WNDCLASSEXW()
+            wc.cbSize = ctypes.sizeof(WNDCLASSEXW)
+            wc.lpfnWndProc = ctypes.cast(user32.DefWindowProcW, ctypes.c_void_p)
+            wc.hInstance = hinstance
+            wc.lpszClassName = RAW_INPUT_WINDOW_CLASS
+            if not user32.RegisterClassExW(byref(wc)):
+                print("Failed to register raw input window class")
+                self.cursor_lock_supported = False
+                return
+            
+            hwnd = CreateWindowExW(0, RAW_INPUT_WINDOW_CLASS, "Mouse to Gamepad Raw Input", 0,
+                                   0, 0, 0, 0, HWND_MESSAGE, None, hinstance, None)
+            if not hwnd:
+                print("Failed to create raw input window")
+                self.cursor_lock_supported = False
+                return
             
             # Register raw input device for mouse
             rid = RAWINPUTDEVICE()
             rid.usUsagePage = 0x01  # Generic desktop
             rid.usUsage = 0x02      # Mouse
             rid.dwFlags = RIDEV_INPUTSINK  # Receive input even when not in foreground
-            rid.hwndTarget = self.hwnd
+            rid.hwndTarget = hwnd
             
-            if not ctypes.windll.user32.RegisterRawInputDevices(byref(rid), 1, ctypes.sizeof(RAWINPUTDEVICE)):
+            if not user32.RegisterRawInputDevices(byref(rid), 1, ctypes.sizeof(RAWINPUTDEVICE)):
                 print("Failed to register raw input device")
                 self.cursor_lock_supported = False
-            else:
-                print("Raw input device registered successfully")
-                
-                # Hook into Windows message processing by subclassing the window proc so WM_INPUT is delivered
-                try:
-                    GWL_WNDPROC = -4
-                    # prototype for WNDPROC: LRESULT CALLBACK WndProc(HWND, UINT, WPARAM, LPARAM)
-                    WNDPROCTYPE = ctypes.WINFUNCTYPE(ctypes.c_long, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
-                    
-                    # Keep Python reference so it doesn't get GC'd
-                    def py_wnd_proc(hwnd, msg, wparam, lparam):
-                        # Intercept WM_INPUT
-                        if msg == WM_INPUT:
-                            try:
-                                # Pass the lparam to process_raw_input
-                                self.process_raw_input(lparam)
-                                # Return 0 to indicate we processed it
-                                return 0
-                            except Exception as e:
-                                print(f"Error in wndproc WM_INPUT handling: {e}")
-                                # fall-through to default processing
-                        # Call the previous/original window proc for default handling
-                        return ctypes.windll.user32.CallWindowProcW(self.original_wndproc, hwnd, msg, wparam, lparam)
-                    
-                    self.new_wndproc = WNDPROCTYPE(py_wnd_proc)
-                    # keep a ref so it isn't garbage collected
-                    self._wndproc_ref = self.new_wndproc
-                    
-                    # set argtypes/restype for SetWindowLongPtrW/CallWindowProcW for safer calls
-                    SetWindowLongPtrW = ctypes.windll.user32.SetWindowLongPtrW
-                    SetWindowLongPtrW.restype = ctypes.c_void_p
-                    SetWindowLongPtrW.argtypes = [wintypes.HWND, ctypes.c_int, ctypes.c_void_p]
-                    
-                    CallWindowProcW = ctypes.windll.user32.CallWindowProcW
-                    CallWindowProcW.restype = ctypes.c_long
-                    CallWindowProcW.argtypes = [ctypes.c_void_p, wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
-                    
-                    # Replace window proc and save original
-                    prev = SetWindowLongPtrW(self.hwnd, GWL_WNDPROC, ctypes.cast(self.new_wndproc, ctypes.c_void_p))
-                    self.original_wndproc = prev
-                    print("Window procedure subclassed for WM_INPUT")
-                except Exception as e:
-                    print(f"Failed to subclass window procedure: {e}")
-                
-                # Hook focus events (kept from original)
-                self.root.bind('<FocusIn>', self.on_focus_in)
-                self.root.bind('<FocusOut>', self.on_focus_out)
-                
+                return
+            
+            print("Raw input device registered successfully")
+            self.raw_input_hwnd = hwnd
+            self.raw_input_thread_id = kernel32.GetCurrentThreadId()
+            self.raw_input_ready.set()
+            
+            # A 32-bit Python on 64-bit Windows (WOW64) gets buffered records in the
+            # 64-bit layout, which drain_raw_input has to account for
+            is_wow64 = wintypes.BOOL(False)
+            kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+            kernel32.IsWow64Process.argtypes = [wintypes.HANDLE, POINTER(wintypes.BOOL)]
+            kernel32.IsWow64Process(kernel32.GetCurrentProcess(), byref(is_wow64))
+            self.raw_input_wow64 = bool(is_wow64.value)
+            
+            # Sleep until raw input or a posted message arrives, then read every queued
+            # packet at once; runs until on_closing posts WM_QUIT
+            msg = wintypes.MSG()
+            wait = user32.MsgWaitForMultipleObjects
+            wait.restype = wintypes.DWORD
+            user32.DispatchMessageW.argtypes = [POINTER(wintypes.MSG)]
+            quit_posted = False
+            while not quit_posted:
+                if wait(0, None, False, INFINITE, QS_RAWINPUT | QS_POSTMESSAGE) == WAIT_FAILED:
+                    print("Raw input wait failed")
+                    self.cursor_lock_supported = False
+                    break
+                # Mark queued input as seen before draining, so input arriving during the
+                # drain still wakes the next wait
+                user32.GetQueueStatus(QS_RAWINPUT)
+                self.drain_raw_input()
+                # Remove every posted message, or one left queued keeps waking the wait;
+                # raw input stays queued for GetRawInputBuffer
+                while user32.PeekMessageW(byref(msg), None, 0, 0, PM_REMOVE | PM_QS_POSTMESSAGE):
+                    if msg.message == WM_QUIT:
+                        quit_posted = True
+                        break
+                    user32.DispatchMessageW(byref(msg))
         except Exception as e:
             print(f"Error setting up raw input: {e}")
             self.cursor_lock_supported = False
+        finally:
+            self.raw_input_ready.set()
+            if hwnd:
+                user32.DestroyWindow(hwnd)
+            if hinstance:
+                user32.UnregisterClassW(RAW_INPUT_WINDOW_CLASS, hinstance)
+            self.raw_input_hwnd = None
+            self.raw_input_thread_id = None
     
     def on_focus_in(self, event):
         """Handle window focus in"""
@@ -256,20 +623,16 @@ class MouseToGamepadGUI:
         """Lock cursor to center of screen"""
         if not self.cursor_lock_supported:
             return False
+        if self.cursor_locked:
+            # Already clipped to the 1x1 rect; Windows keeps the cursor there, no re-center needed
+            return True
             
         try:
-            # Move cursor to center
-            ctypes.windll.user32.SetCursorPos(self.center_x, self.center_y)
-            
-            # Create 1x1 rectangle at center
-            rect = RECT()
-            rect.left = self.center_x
-            rect.top = self.center_y
-            rect.right = self.center_x + 1
-            rect.bottom = self.center_y + 1
+            # Move cursor to center once per lock transition
+            self.set_cursor_pos(self.center_x, self.center_y)
             
-            # Lock cursor
-            if ctypes.windll.user32.ClipCursor(byref(rect)):
+            # Lock cursor to the 1x1 rectangle at center
+            if ctypes.windll.user32.ClipCursor(byref(self.lock_rect)):
                 self.cursor_locked = True
                 self.lock_position = (self.center_x, self.center_y)
                 print("Cursor locked to center")
@@ -295,73 +658,137 @@ class MouseToGamepadGUI:
         except Exception as e:
             print(f"Error unlocking cursor: {e}")
     
-    def process_raw_input(self, lparam):
-        """Process raw input message"""
+    def drain_raw_input(self):
+        """Read all pending raw input with GetRawInputBuffer and queue the summed mouse motion"""
         try:
-            # Get size needed
-            size = c_uint()
-            res = ctypes.windll.user32.GetRawInputData(
-                ctypes.wintypes.HANDLE(lparam), RID_INPUT, None, byref(size), ctypes.sizeof(RAWINPUTHEADER)
-            )
-            # size now contains required bytes
-            if size.value == 0:
-                return
-            
-            # Allocate buffer
-            buffer = (ctypes.c_byte * size.value)()
-            
-            # Get actual data
-            result = ctypes.windll.user32.GetRawInputData(
-                ctypes.wintypes.HANDLE(lparam), RID_INPUT, buffer, byref(size), ctypes.sizeof(RAWINPUTHEADER)
-            )
-            
-            if result != size.value:
-                return
-            
-            # Cast to RAWINPUT structure pointer and read
-            raw_input = ctypes.cast(buffer, POINTER(RAWINPUT)).contents
+            buffer = self.raw_input_buffer
+            size = self.raw_input_size
+            get_raw_input_buffer = self.get_raw_input_buffer
+            header_size = ctypes.sizeof(RAWINPUTHEADER)
+            if self.raw_input_wow64:
+                # 64-bit layout: the header's handle fields are 8 bytes longer in total
+                # and records are 8-byte aligned
+                data_offset = header_size + 8
+                align = 7
+            else:
+                # Records start on pointer-size boundaries (NEXTRAWINPUTBLOCK)
+                data_offset = header_size
+                align = ctypes.sizeof(ctypes.c_void_p) - 1
             
-            # Check if it's mouse input
-            if raw_input.header.dwType == RIM_TYPEMOUSE:
-                # Get mouse deltas
-                dx = raw_input.mouse.lLastX
-                dy = raw_input.mouse.lLastY
+            dx = dy = 0
+            while True:
+                size.value = RAW_INPUT_BUFFER_SIZE
+                count = get_raw_input_buffer(buffer, byref(size), header_size)
+                if count <= 0:
+                    break
                 
-                # Store raw deltas thread-safely
-                with self.raw_input_lock:
-                    self.raw_dx += dx
-                    self.raw_dy += dy
+                offset = 0
+                for _ in range(count):
+                    header = RAWINPUTHEADER.from_buffer(buffer, offset)
+                    if header.dwType == RIM_TYPEMOUSE:
+                        mouse = RAWMOUSE.from_buffer(buffer, offset + data_offset)
+                        dx += mouse.lLastX
+                        dy += mouse.lLastY
+                    offset = (offset + header.dwSize + align) & ~align
+            
+            # Button and wheel packets carry no motion
+            if dx or dy:
+                self.raw_deltas.append((dx, dy))
+                self.motion_event.set()
         except Exception as e:
-            print(f"Error processing raw input: {e}")
+            print(f"Error reading raw input: {e}")
     
     def get_and_clear_raw_deltas(self):
-        """Get accumulated raw mouse deltas and clear them"""
-        with self.raw_input_lock:
-            dx, dy = self.raw_dx, self.raw_dy
-            self.raw_dx = 0
-            self.raw_dy = 0
+        """Sum and remove the raw mouse deltas queued since the last call"""
+        pending = self.raw_deltas
+        popleft = pending.popleft
+        dx = dy = 0
+        # Only take what was queued on entry; packets arriving meanwhile wait for the next tick
+        for _ in range(len(pending)):
+            px, py = popleft()
+            dx += px
+            dy += py
         return dx, dy
     
+    def sync_cursor_position(self):
+        """Record the current cursor position without producing a delta"""
+        self.get_cursor_pos(self.cursor_pos_ref)
+        self.last_mx, self.last_my = self.cursor_pos.x, self.cursor_pos.y
+    
+    def poll_cursor_deltas(self):
+        """Get cursor movement since the last poll (fallback when raw input is unavailable)"""
+        pt = self.cursor_pos
+        self.get_cursor_pos(self.cursor_pos_ref)
+        mx, my = pt.x, pt.y
+        
+        dx = mx - self.last_mx
+        dy = my - self.last_my
+        self.last_mx, self.last_my = mx, my
+        
+        # Recenter the cursor when it strays too far so it never pins against a screen edge
+        # (squared distance against a squared radius, no sqrt needed)
+        ddx = mx - self.center_x
+        ddy = my - self.center_y
+        if ddx * ddx + ddy * ddy > self.recenter_radius_sq:
+            self.set_cursor_pos(self.center_x, self.center_y)
+            self.last_mx, self.last_my = self.center_x, self.center_y
+        return dx, dy
+    
+    def open_tick_timer(self, period_ms):
+        """Create a periodic high-resolution waitable timer, or None to fall back to sleep"""
+        kernel32 = ctypes.windll.kernel32
+        try:
+            kernel32.CreateWaitableTimerExW.restype = wintypes.HANDLE
+            kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+            kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+            timer = kernel32.CreateWaitableTimerExW(None, None, CREATE_WAITABLE_TIMER_HIGH_RESOLUTION,
+                                                     TIMER_ALL_ACCESS)
+            if timer:
+                due = ctypes.c_longlong(-period_ms * 10000)  # relative, in 100 ns units
+                kernel32.SetWaitableTimer.argtypes = [wintypes.HANDLE, POINTER(ctypes.c_longlong), c_long,
+                                                      ctypes.c_void_p, ctypes.c_void_p, wintypes.BOOL]
+                if kernel32.SetWaitableTimer(timer, byref(due), period_ms, None, None, False):
+                    return timer
+                kernel32.CloseHandle(timer)
+        except Exception as e:
+            print(f"Error creating high-resolution timer: {e}")
+        
+        # Older Windows: raise the system timer resolution so time.sleep is accurate
+        print("High-resolution timer unavailable, using time.sleep")
+        ctypes.windll.winmm.timeBeginPeriod(1)
+        return None
+    
+    def close_tick_timer(self, timer):
+        """Release the control loop timer opened by open_tick_timer"""
+        if timer:
+            ctypes.windll.kernel32.CloseHandle(timer)
+        else:
+            ctypes.windll.winmm.timeEndPeriod(1)
+    
     # [Previous methods remain the same - load_settings, apply_default_settings, etc.]
     def load_settings(self):
         """Load settings from file, use defaults if file doesn't exist"""
         try:
             if self.settings_file.exists():
-                with open(self.settings_file, 'r') as f:
-                    settings = json.load(f)
+                settings = json_loads(self.settings_file.read_bytes())
                 
                 self.sensitivity.set(settings.get('sensitivity', self.default_settings['sensitivity']))
                 self.decay_rate.set(settings.get('decay_rate', self.default_settings['decay_rate']))
                 self.deadzone.set(settings.get('deadzone', self.default_settings['deadzone']))
                 self.smoothing.set(settings.get('smoothing', self.default_settings['smoothing']))
+                self.update_interval.set(settings.get('update_interval', self.default_settings['update_interval']))
                 self.x_axis_enabled.set(settings.get('x_axis_enabled', self.default_settings['x_axis_enabled']))
                 self.y_axis_enabled.set(settings.get('y_axis_enabled', self.default_settings['y_axis_enabled']))
                 self.invert_x.set(settings.get('invert_x', self.default_settings['invert_x']))
                 self.invert_y.set(settings.get('invert_y', self.default_settings['invert_y']))
                 
-                control_points = settings.get('control_points', self.default_settings['control_points'])
-                if len(control_points) >= 2 and all(isinstance(p, list) and len(p) == 2 for p in control_points):
-                    self.control_points = [(float(p[0]), float(p[1])) for p in control_points]
+                # Validate and convert in the same pass; any malformed point rejects the list
+                try:
+                    control_points = [(float(x), float(y)) for x, y in settings['control_points']]
+                except (KeyError, TypeError, ValueError):
+                    control_points = []
+                if len(control_points) >= 2:
+                    self.control_points = control_points
                 else:
                     self.control_points = self.default_settings['control_points'].copy()
                     
@@ -379,20 +806,22 @@ class MouseToGamepadGUI:
         self.decay_rate.set(self.default_settings['decay_rate'])
         self.deadzone.set(self.default_settings['deadzone'])
         self.smoothing.set(self.default_settings['smoothing'])
+        self.update_interval.set(self.default_settings['update_interval'])
         self.x_axis_enabled.set(self.default_settings['x_axis_enabled'])
         self.y_axis_enabled.set(self.default_settings['y_axis_enabled'])
         self.invert_x.set(self.default_settings['invert_x'])
         self.invert_y.set(self.default_settings['invert_y'])
         self.control_points = self.default_settings['control_points'].copy()
     
-    def save_settings(self):
-        """Save current settings to file"""
+    def save_settings(self, background=True):
+        """Save current settings to file, writing on a worker thread unless background is False"""
         try:
             settings = {
                 'sensitivity': self.sensitivity.get(),
                 'decay_rate': self.decay_rate.get(),
                 'deadzone': self.deadzone.get(),
                 'smoothing': self.smoothing.get(),
+                'update_interval': self.update_interval.get(),
                 'x_axis_enabled': self.x_axis_enabled.get(),
                 'y_axis_enabled': self.y_axis_enabled.get(),
                 'invert_x': self.invert_x.get(),
@@ -400,18 +829,45 @@ class MouseToGamepadGUI:
                 'control_points': [[p[0], p[1]] for p in self.control_points]
             }
             
-            with open(self.settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
-                
-            print(f"Settings saved to {self.settings_file}")
+            # Serialize on the Tk thread; only the disk I/O moves off it
+            data = json.dumps(settings, indent=2)
         except Exception as e:
             print(f"Error saving settings: {e}")
+            return
+        
+        self.settings_save_seq += 1
+        if background:
+            threading.Thread(target=self.write_settings_file, args=(data, self.settings_save_seq),
+                             daemon=True).start()
+        else:
+            self.write_settings_file(data, self.settings_save_seq)
+    
+    def write_settings_file(self, data, seq):
+        """Atomically replace the settings file, skipping writes older than one already on disk"""
+        with self.settings_write_lock:
+            if seq <= self.settings_written_seq:
+                return
+            try:
+                tmp_file = self.settings_file.with_suffix('.tmp')
+                with open(tmp_file, 'w') as f:
+                    f.write(data)
+                os.replace(tmp_file, self.settings_file)
+                self.settings_written_seq = seq
+                
+                print(f"Settings saved to {self.settings_file}")
+            except Exception as e:
+                print(f"Error saving settings: {e}")
     
     def schedule_auto_save(self):
-        """Schedule an auto-save after a delay"""
-        if self.auto_save_after_id:
-            self.root.after_cancel(self.auto_save_after_id)
-        self.auto_save_after_id = self.root.after(1000, self.save_settings)
+        """Mark the settings as changed so the next auto-save pass writes them"""
+        self.settings_dirty = True
+    
+    def run_auto_save(self):
+        """Write the settings if anything changed since the last pass, then check again later"""
+        if self.settings_dirty:
+            self.settings_dirty = False
+            self.save_settings()
+        self.root.after(AUTO_SAVE_DELAY_MS, self.run_auto_save)
     
     def reset_to_defaults(self):
         """Reset all settings to defaults"""
@@ -420,7 +876,7 @@ class MouseToGamepadGUI:
             self.apply_default_settings()
             self.update_spline()
             self.draw_curve()
-            self.draw_joystick_background()
+            self.update_axis_labels()
             self.schedule_auto_save()
             print("Settings reset to defaults")
     
@@ -452,21 +908,44 @@ class MouseToGamepadGUI:
         canvas.pack(side="left", fill="both", expand=True)
         v_scrollbar.pack(side="right", fill="y")
         
+        # Resolve the platform once; platform.system() is not cached by the stdlib
+        system = platform.system()
+        
+        # Wheel events arrive in bursts; sum them and scroll once per idle pass
+        self.wheel_accum = 0.0
+        self.wheel_pending = False
+        
+        def _apply_wheel():
+            self.wheel_pending = False
+            units = int(self.wheel_accum)
+            # Keep the fractional remainder from high-resolution wheels for the next burst
+            self.wheel_accum -= units
+            if units:
+                canvas.yview_scroll(units, "units")
+        
+        def _queue_wheel(units):
+            self.wheel_accum += units
+            if not self.wheel_pending:
+                self.wheel_pending = True
+                self.root.after_idle(_apply_wheel)
+        
         def _on_mousewheel(event):
-            if platform.system() == 'Darwin':
-                canvas.yview_scroll(int(-1 * event.delta), "units")
-            else:
-                canvas.yview_scroll(int(-1 * (event.delta/120)), "units")
+            _queue_wheel(-1 * (event.delta/120))
+        
+        def _on_darwin_mousewheel(event):
+            _queue_wheel(-1 * event.delta)
         
         def _on_linux_scroll_up(event):
-            canvas.yview_scroll(-1, "units")
+            _queue_wheel(-1)
         
         def _on_linux_scroll_down(event):
-            canvas.yview_scroll(1, "units")
+            _queue_wheel(1)
         
-        if platform.system() == 'Linux':
+        if system == 'Linux':
             canvas.bind_all("<Button-4>", _on_linux_scroll_up)
             canvas.bind_all("<Button-5>", _on_linux_scroll_down)
+        elif system == 'Darwin':
+            canvas.bind_all("<MouseWheel>", _on_darwin_mousewheel)
         else:
             canvas.bind_all("<MouseWheel>", _on_mousewheel)
         
@@ -662,6 +1141,26 @@ class MouseToGamepadGUI:
         self.smooth_value = tk.Label(param_grid, text="0.30", bg='#2a2a2a', fg='#0f0', width=5)
         self.smooth_value.grid(row=3, column=2)
         
+        # Update interval
+        tk.Label(param_grid, text="Update (ms):", bg='#2a2a2a', fg='#fff', 
+                font=('Arial', 9), width=10, anchor='w').grid(row=4, column=0, sticky='w')
+        self.interval_slider = tk.Scale(param_grid, from_=1, to=10, orient=tk.HORIZONTAL, 
+                                        variable=self.update_interval, 
+                                        bg='#3a3a3a', fg='#fff', highlightthickness=0, length=200,
+                                        command=lambda v: self.schedule_auto_save())
+        self.interval_slider.grid(row=4, column=1, padx=5)
+        self.interval_value = tk.Label(param_grid, text="4", bg='#2a2a2a', fg='#0f0', width=5)
+        self.interval_value.grid(row=4, column=2)
+        
+        # Value readouts follow their variables instead of being refreshed every frame
+        self.bind_value_label(self.sensitivity, self.sens_value, "{:.0f}")
+        self.bind_value_label(self.decay_rate, self.decay_value, "{:.2f}")
+        self.bind_value_label(self.deadzone, self.dead_value, "{:.2f}")
+        self.bind_value_label(self.smoothing, self.smooth_value, "{:.2f}")
+        self.bind_value_label(self.update_interval, self.interval_value, "{}")
+        # The deadzone marker is part of the curve editor
+        self.deadzone.trace_add('write', self.schedule_curve_redraw)
+        
         # Response Curve Editor
         curve_container = tk.LabelFrame(main_frame, text="Response Curve Editor (Drag Points)", 
                                         bg='#2a2a2a', fg='#ffffff', font=('Arial', 10, 'bold'))
@@ -709,15 +1208,25 @@ class MouseToGamepadGUI:
         self.joystick_canvas.create_oval(20, 20, 160, 160, outline='#333', width=1)
         self.joystick_canvas.create_oval(5, 5, 175, 175, outline='#2a2a2a', width=2)
         
-        if not self.x_axis_enabled.get():
-            self.joystick_canvas.create_text(90, 170, text="X OFF", fill='#f55', 
-                                            font=('Arial', 7, 'bold'))
-        if not self.y_axis_enabled.get():
-            self.joystick_canvas.create_text(10, 90, text="Y\nOFF", fill='#f55', 
-                                            font=('Arial', 7, 'bold'))
+        # Axis OFF labels stay on the canvas and are shown/hidden by update_axis_labels
+        self.x_off_label = self.joystick_canvas.create_text(90, 170, text="X OFF", fill='#f55', 
+                                                            font=('Arial', 7, 'bold'))
+        self.y_off_label = self.joystick_canvas.create_text(10, 90, text="Y\nOFF", fill='#f55', 
+                                                            font=('Arial', 7, 'bold'))
+        self.update_axis_labels()
         
         self.joystick_dot = self.joystick_canvas.create_oval(85, 85, 95, 95, 
                                                              fill='#0f0', outline='#0a0', width=2)
+        # Where the dot's center is and what it is filled with, so updates can be relative
+        self.dot_pos = (90, 90)
+        self.dot_color = '#0f0'
+    
+    def update_axis_labels(self):
+        """Show the OFF label for each disabled axis"""
+        self.joystick_canvas.itemconfig(self.x_off_label,
+                                        state=tk.HIDDEN if self.x_axis_enabled.get() else tk.NORMAL)
+        self.joystick_canvas.itemconfig(self.y_off_label,
+                                        state=tk.HIDDEN if self.y_axis_enabled.get() else tk.NORMAL)
     
     def draw_curve_background(self):
         w, h = 350, 280
@@ -746,23 +1255,40 @@ class MouseToGamepadGUI:
         self.curve_canvas.create_text(15, h/2, text="Out", fill='#aaa', font=('Arial', 8), angle=90, tags="background")
         
         self.deadzone_line = self.curve_canvas.create_line(0, 0, 0, 0, fill='#f55', width=1, dash=(3, 3), tags="background")
+        
+        # Preview sample grid; x pixels are fixed, draw_curve only fills in the y pixels
+        self.preview_xs = np.linspace(0.0, 1.0, 101)
+        self.preview_points = np.empty(2 * len(self.preview_xs))
+        self.preview_points[0::2] = margin + self.preview_xs * (w - 2*margin)
+        self.preview_points[1::2] = np.inf  # nothing drawn yet, so the first pass always draws
+        
+        # Curve and control point items are created once and moved by draw_curve
+        self.curve_line = self.curve_canvas.create_line(0, 0, 0, 0, fill='#0f0', width=2,
+                                                        smooth=True, tags="curve")
+        self.point_items = []  # (canvas item, current fill) per control point
     
     def update_spline(self):
-        if len(self.control_points) >= 2:
-            x_points = [p[0] for p in self.control_points]
-            y_points = [p[1] for p in self.control_points]
+        self.last_point_index = len(self.control_points) - 1
+        if self.last_point_index >= 1:
+            # One conversion into x and y columns for the fit, the check and the fallback
+            points = np.array(self.control_points, dtype=np.float64)
+            x_points, y_points = points[:, 0], points[:, 1]
             
-            try:
-                self.spline = interpolate.interp1d(x_points, y_points, kind='cubic', 
-                                                   bounds_error=False, fill_value='extrapolate')
-            except:
-                self.spline = interpolate.interp1d(x_points, y_points, kind='linear', 
-                                                   bounds_error=False, fill_value='extrapolate')
+            # Sample the curve once; the control loop and the editor only read the table
+            xs = self.curve_lut_xs
+            # The cubic fit needs strictly increasing x; anything else (e.g. a hand-edited
+            # settings file) falls back to straight segments
+            if np.all(np.diff(x_points) > 0):
+                knots, coeffs = pchip_coefficients(x_points, y_points)
+                ys = evaluate_segments(knots, coeffs, xs)
+            else:
+                ys = np.interp(xs, x_points, y_points)
+            self.curve_lut = np.clip(ys, 0.0, 1.0).astype(np.float32)
+            # Table handed to the per-tick kernels. Compiled they take the array directly;
+            # as plain Python a list of floats avoids boxing a NumPy scalar per lookup
+            self.curve_lut_values = self.curve_lut if NUMBA_AVAILABLE else self.curve_lut.tolist()
     
     def draw_curve(self):
-        self.curve_canvas.delete("curve")
-        self.curve_canvas.delete("points")
-        
         w, h = 350, 280
         margin = 35
         
@@ -770,33 +1296,39 @@ class MouseToGamepadGUI:
         if dz > 0:
             dz_x = margin + dz * (w - 2*margin)
             self.curve_canvas.coords(self.deadzone_line, dz_x, margin, dz_x, h-margin)
-        
-        if self.spline:
-            points = []
-            for i in range(101):
-                x = i / 100.0
-                try:
-                    y = float(self.spline(x))
-                    y = max(0, min(1, y))
-                except:
-                    y = x
-                
-                px = margin + x * (w - 2*margin)
-                py = h - margin - y * (h - 2*margin)
-                points.extend([px, py])
-            
-            if len(points) > 2:
-                self.curve_canvas.create_line(points, fill='#0f0', width=2, 
-                                             smooth=True, tags="curve")
+        else:
+            self.curve_canvas.coords(self.deadzone_line, 0, 0, 0, 0)
+        
+        # All 101 preview samples in one vectorized pass over the curve table
+        ys = np.interp(self.preview_xs, self.curve_lut_xs, self.curve_lut)
+        pys = h - margin - ys * (h - 2*margin)
+        
+        # Skip the canvas update unless some sample moved by at least half a pixel from
+        # what is on screen, e.g. for tiny drags or redraws with an unchanged curve
+        points = self.preview_points
+        if np.max(np.abs(pys - points[1::2])) >= 0.5:
+            points[1::2] = pys
+            self.curve_canvas.coords(self.curve_line, points.tolist())
+        
+        # Reuse one oval per control point; only create or delete when the count changes
+        ovals = self.point_items
+        count = self.last_point_index + 1
+        while len(ovals) < count:
+            ovals.append((self.curve_canvas.create_oval(0, 0, 0, 0, outline='#fff', width=2, tags="points"), None))
+        while len(ovals) > count:
+            self.curve_canvas.delete(ovals.pop()[0])
         
         for i, (x, y) in enumerate(self.control_points):
             px = margin + x * (w - 2*margin)
             py = h - margin - y * (h - 2*margin)
             
-            color = '#f55' if i == 0 or i == len(self.control_points) - 1 else '#ff0'
+            color = '#f55' if i == 0 or i == self.last_point_index else '#ff0'
             
-            self.curve_canvas.create_oval(px-5, py-5, px+5, py+5, 
-                                         fill=color, outline='#fff', width=2, tags="points")
+            item, item_color = ovals[i]
+            self.curve_canvas.coords(item, px-5, py-5, px+5, py+5)
+            if color != item_color:
+                self.curve_canvas.itemconfig(item, fill=color)
+                ovals[i] = (item, color)
     
     def on_curve_click(self, event):
         w, h = 350, 280
@@ -806,8 +1338,16 @@ class MouseToGamepadGUI:
             px = margin + x * (w - 2*margin)
             py = h - margin - y * (h - 2*margin)
             
-            if ((event.x - px)**2 + (event.y - py)**2)**0.5 < 10:
-                if i != 0 and i != len(self.control_points) - 1:
+            # Within a 10 px radius, compared squared; reject on x alone first. Points
+            # are sorted by x, so once one lies past the cursor every later one does too
+            dx = event.x - px
+            if dx >= 10:
+                continue
+            if dx <= -10:
+                return
+            dy = event.y - py
+            if dx * dx + dy * dy < 100:
+                if i != 0 and i != self.last_point_index:
                     self.selected_point = i
                 return
     
@@ -824,12 +1364,28 @@ class MouseToGamepadGUI:
             
             if self.selected_point > 0:
                 x = max(x, self.control_points[self.selected_point - 1][0] + 0.01)
-            if self.selected_point < len(self.control_points) - 1:
+            if self.selected_point < self.last_point_index:
                 x = min(x, self.control_points[self.selected_point + 1][0] - 0.01)
             
             self.control_points[self.selected_point] = (x, y)
+            
+            # Motion events arrive at mouse rate; rebuild and redraw at most once per idle pass
+            self.curve_spline_stale = True
+            self.schedule_curve_redraw()
+    
+    def schedule_curve_redraw(self, *_):
+        """Redraw the curve editor once on the next idle pass"""
+        if not self.curve_redraw_pending:
+            self.curve_redraw_pending = True
+            self.root.after_idle(self.flush_curve_redraw)
+    
+    def flush_curve_redraw(self):
+        """Apply the latest dragged control point and deadzone to the curve canvas"""
+        self.curve_redraw_pending = False
+        if self.curve_spline_stale:
+            self.curve_spline_stale = False
             self.update_spline()
-            self.draw_curve()
+        self.draw_curve()
     
     def on_curve_release(self, event):
         if self.selected_point is not None:
@@ -837,59 +1393,35 @@ class MouseToGamepadGUI:
         self.selected_point = None
     
     def load_preset(self, preset_name):
-        if preset_name == 'linear':
-            self.control_points = [(0, 0), (0.25, 0.25), (0.5, 0.5), (0.75, 0.75), (1.0, 1.0)]
-        elif preset_name == 'aggressive':
-            self.control_points = [(0, 0), (0.25, 0.1), (0.5, 0.3), (0.75, 0.65), (1.0, 1.0)]
-        elif preset_name == 'precise':
-            self.control_points = [(0, 0), (0.25, 0.35), (0.5, 0.6), (0.75, 0.82), (1.0, 1.0)]
-        elif preset_name == 's-curve':
-            self.control_points = [(0, 0), (0.25, 0.15), (0.5, 0.5), (0.75, 0.85), (1.0, 1.0)]
-        
-        self.update_spline()
-        self.draw_curve()
-        self.schedule_auto_save()
-    
-    def apply_response_curve(self, value):
-        abs_value = abs(value)
-        sign = 1 if value >= 0 else -1
-        
-        if abs_value < self.deadzone.get():
-            return 0
-        
-        normalized = (abs_value - self.deadzone.get()) / (1 - self.deadzone.get())
+        points = CURVE_PRESETS.get(preset_name)
+        if points is None:
+            return
+        # A fresh list, since dragging edits the control points in place
+        self.control_points = list(points)
         
-        if self.spline:
-            try:
-                result = float(self.spline(normalized))
-                result = max(0, min(1, result))
-            except:
-                result = normalized
+        # Presets never change, so each is fitted once and reused on later loads
+        cached = self.preset_curves.get(preset_name)
+        if cached is None:
+            self.update_spline()
+            self.preset_curves[preset_name] = (self.curve_lut, self.curve_lut_values)
         else:
-            result = normalized
+            self.last_point_index = len(points) - 1
+            self.curve_lut, self.curve_lut_values = cached
+        self.curve_spline_stale = False
         
-        return sign * result
-    
-    def apply_smoothing(self, current_x, current_y):
-        """Apply exponential smoothing to joystick values"""
-        smooth_factor = self.smoothing.get()
-        alpha = 1.0 - smooth_factor
-        
-        self.smooth_x = self.smooth_x * smooth_factor + current_x * alpha
-        self.smooth_y = self.smooth_y * smooth_factor + current_y * alpha
-        
-        return self.smooth_x, self.smooth_y
+        self.draw_curve()
+        self.schedule_auto_save()
     
     def on_axis_toggle(self):
-        self.draw_joystick_background()
+        self.update_axis_labels()
         
         if not self.x_axis_enabled.get():
             self.joystick_x = 0
-            self.raw_x = 0
+            self.raw_x = 0.0
             self.smooth_x = 0
         if not self.y_axis_enabled.get():
             self.joystick_y = 0
-            self.raw_y = 0
+            self.raw_y = 0.0
             self.smooth_y = 0
             
         self.schedule_auto_save()
@@ -903,6 +1435,7 @@ class MouseToGamepadGUI:
         if not self.running:
             self.running = True
             self.paused = False
+            self.resume_event.set()
             self.toggle_btn.config(text="⏹ STOP", bg='#f44336')
             self.pause_btn.config(state=tk.NORMAL)
             self.status_label.config(text="🟢 Active", fg='#0f0')
@@ -926,6 +1459,10 @@ class MouseToGamepadGUI:
     
     def stop_control(self):
         self.running = False
+        self.paused = False
+        # Wake control_loop if it is blocked in the paused or idle state
+        self.resume_event.set()
+        self.motion_event.set()
         self.toggle_btn.config(text="▶ START", bg='#4CAF50')
         self.pause_btn.config(state=tk.DISABLED, text="⏸ PAUSE")
         self.status_label.config(text="⚫ Stopped", fg='#f55')
@@ -934,7 +1471,7 @@ class MouseToGamepadGUI:
         # Unlock cursor
         self.unlock_cursor()
         
-        self.gamepad.left_joystick_float(x_value_float=0.0, y_value_float=0.0)
+        self.gamepad.reset()
         self.gamepad.update()
         
         self.smooth_x = 0.0
@@ -951,6 +1488,7 @@ class MouseToGamepadGUI:
         
         self.paused = not self.paused
         if self.paused:
+            self.resume_event.clear()
             # Enter paused state: unlock cursor if it was locked and zero gamepad
             self.pause_btn.config(text="▶ RESUME", bg='#4CAF50')
             self.status_label.config(text="⏸ Paused", fg='#FFA500')
@@ -959,10 +1497,11 @@ class MouseToGamepadGUI:
                 self.unlock_cursor()
                 self.lock_status_label.config(text="🔓 Cursor Free", fg='#888')
             # Zero the gamepad output immediately
-            self.gamepad.left_joystick_float(x_value_float=0.0, y_value_float=0.0)
+            self.gamepad.reset()
             self.gamepad.update()
         else:
             # Resume: attempt to re-lock cursor if supported
+            self.resume_event.set()
             self.pause_btn.config(text="⏸ PAUSE", bg='#FFA500')
             self.status_label.config(text="🟢 Active", fg='#0f0')
             if self.cursor_lock_supported:
@@ -981,146 +1520,212 @@ class MouseToGamepadGUI:
             self.root.after(0, self.quit_app)
             return False
         
-        try:
-            if hasattr(key, 'char'):
-                if key.char == '`':
-                    self.root.after(0, self.toggle_pause)
-                elif key.char == '[':
-                    self.root.after(0, lambda: self.adjust_sensitivity(-2))
-                elif key.char == ']':
-                    self.root.after(0, lambda: self.adjust_sensitivity(2))
-        except AttributeError:
-            pass
+        action = self.hotkey_actions.get(getattr(key, 'char', None))
+        if action:
+            self.key_actions.append(action)
+            # One Tk wakeup per burst (e.g. key repeat) instead of one per key
+            if not self.key_drain_pending:
+                self.key_drain_pending = True
+                self.root.after(0, self.drain_key_actions)
+    
+    def drain_key_actions(self):
+        """Run every hotkey action queued by the keyboard listener"""
+        self.key_drain_pending = False
+        pending = self.key_actions
+        while pending:
+            pending.popleft()()
     
     def control_loop(self):
-            """Main control loop using raw input when cursor is locked"""
+            """Main control loop using raw input when cursor is locked, cursor polling otherwise"""
+            # Ticks are latency sensitive; don't let ordinary foreground work preempt them
+            try:
+                kernel32 = ctypes.windll.kernel32
+                kernel32.GetCurrentThread.restype = wintypes.HANDLE
+                kernel32.SetThreadPriority.argtypes = [wintypes.HANDLE, c_int]
+                if not kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_PRIORITY_ABOVE_NORMAL):
+                    print("Could not raise control loop thread priority")
+            except Exception as e:
+                print(f"Error raising control loop thread priority: {e}")
+            
             if self.cursor_lock_supported and self.cursor_locked:
                 # Raw input mode - cursor is locked
                 print("Starting raw input control loop")
-                
+                get_deltas = self.get_and_clear_raw_deltas
+                discard_deltas = self.get_and_clear_raw_deltas
+                motion_event = self.motion_event
+                pending_deltas = self.raw_deltas
+            else:
+                # Fallback mode - poll the cursor position directly through user32
+                print("Starting cursor polling control loop")
+                self.sync_cursor_position()
+                get_deltas = self.poll_cursor_deltas
+                discard_deltas = self.sync_cursor_position
+                # Polling has nobody to signal motion, so it keeps ticking when idle
+                motion_event = None
+            
+            # Last stick report sent, in vgamepad's int16 units
+            last_ix, last_iy = 0, 0
+            
+            # Bind the gamepad calls once; the int16 API skips vgamepad's float conversion
+            left_joystick = self.gamepad.left_joystick
+            update_gamepad = self.gamepad.update
+            
+            # Bind the remaining hot globals and methods to locals for the loop body
+            process = process_stick
+            sleep = time.sleep
+            
+            # Steady tick at the update interval; deltas from faster mice are summed in between
+            tick_ms = self._tick_ms
+            timer = self.open_tick_timer(tick_ms)
+            tick_seconds = tick_ms / 1000.0
+            wait_for_tick = ctypes.windll.kernel32.WaitForSingleObject
+            perf_counter = time.perf_counter
+            next_tick = perf_counter()
+            
+            try:
                 while self.running:
+                    # The interval was changed while running; restart the tick at the new period
+                    if self._tick_ms != tick_ms:
+                        self.close_tick_timer(timer)
+                        tick_ms = self._tick_ms
+                        timer = self.open_tick_timer(tick_ms)
+                        tick_seconds = tick_ms / 1000.0
+                        next_tick = perf_counter()
+                    
+                    if timer:
+                        wait_for_tick(timer, INFINITE)
+                    else:
+                        # Sleep to an absolute deadline so oversleeps don't accumulate into drift;
+                        # after a long stall resync instead of bursting to catch up
+                        next_tick += tick_seconds
+                        delay = next_tick - perf_counter()
+                        if delay > 0:
+                            sleep(delay)
+                        elif delay < -tick_seconds:
+                            next_tick = perf_counter()
+                    
                     if not self.paused:
-                        # Get raw mouse deltas
-                        dx, dy = self.get_and_clear_raw_deltas()
-                        
-                        sens = self.sensitivity.get()
-                        decay = self.decay_rate.get()
-                        
-                        if self.x_axis_enabled.get():
-                            # scale raw deltas to a smaller float range; tweak multiplier if needed
-                            self.raw_x += dx * sens * 0.00005
-                            self.raw_x *= decay
-                            self.raw_x = max(-1.0, min(1.0, self.raw_x))
-                            
-                            joystick_x = self.apply_response_curve(self.raw_x)
-                            if self.invert_x.get():
-                                joystick_x = -joystick_x
-                        else:
-                            joystick_x = 0
-                            self.raw_x = 0
+                        # Get mouse deltas
+                        dx, dy = get_deltas()
                         
-                        if self.y_axis_enabled.get():
-                            self.raw_y += dy * sens * 0.00005
-                            self.raw_y *= decay
-                            self.raw_y = max(-1.0, min(1.0, self.raw_y))
-                            
-                            joystick_y = self.apply_response_curve(-self.raw_y)
-                            if self.invert_y.get():
-                                joystick_y = -joystick_y
-                        else:
-                            joystick_y = 0
-                            self.raw_y = 0
-                        
-                        # Apply smoothing
-                        self.joystick_x, self.joystick_y = self.apply_smoothing(joystick_x, joystick_y)
-                        
-                        self.gamepad.left_joystick_float(x_value_float=self.joystick_x, 
-                                                        y_value_float=self.joystick_y)
-                        self.gamepad.update()
-                    else:
-                        # While paused, keep clearing raw input to prevent accumulation
-                        self.get_and_clear_raw_deltas()
+                        # Common case: no motion and the stick already at rest, nothing to do
+                        if not (dx or dy or self.raw_x or self.raw_y or last_ix or last_iy):
+                            # Sleep until the input thread queues motion (or stop_control wakes
+                            # us). Clear before checking the queue so a late packet can't be missed
+                            if motion_event:
+                                motion_event.clear()
+                                # Re-check running after the clear: a stop_control wakeup set
+                                # between the loop test and the clear would otherwise be lost
+                                if not pending_deltas and self.running:
+                                    motion_event.wait()
+                            continue
                     
-                    time.sleep(0.001)  # Very fast update rate for raw input
-            
-            # When leaving loop or when cursor lock not supported, ensure returned to zero
-            self.gamepad.left_joystick_float(x_value_float=0.0, y_value_float=0.0)
+                        scale = self._sens_scale * self._delta_gain
+                        decay = self._decay_f
+                        deadzone = self._deadzone_f
+                        inv_one_minus_dz = self._inv_one_minus_dz
+                        lut = self.curve_lut_values
+                        smoothing = self._smooth_f
+                    
+                        # One kernel call for both axes, down to the quantized report
+                        self.raw_x, self.raw_y, self.smooth_x, self.smooth_y, ix, iy = process(
+                            self.raw_x, self.raw_y, dx, dy, scale, decay, deadzone, inv_one_minus_dz,
+                            lut, self.smooth_x, self.smooth_y, smoothing, self._x_sign, self._y_sign)
+                        self.joystick_x, self.joystick_y = self.smooth_x, self.smooth_y
+                    
+                        # Deltas are drained once per tick; only send a report when the
+                        # quantized stick value actually changed
+                        if ix != last_ix or iy != last_iy:
+                            left_joystick(x_value=ix, y_value=iy)
+                            update_gamepad()
+                            last_ix, last_iy = ix, iy
+                    else:
+                        # Block until resumed or stopped, then drop movement made while paused
+                        self.resume_event.wait()
+                        discard_deltas()
+                        # toggle_pause zeroed the gamepad
+                        last_ix, last_iy = 0, 0
+            finally:
+                self.close_tick_timer(timer)
+        
+            # When leaving loop, ensure returned to zero
+            self.gamepad.reset()
             self.gamepad.update()
     
+    def bind_value_label(self, var, label, fmt):
+        """Show a Tk variable's value in a label, updated whenever the variable is written"""
+        def sync(*_):
+            try:
+                label.config(text=fmt.format(var.get()))
+            except tk.TclError:
+                pass
+        var.trace_add('write', sync)
+        sync()
+    
     def update_display(self):
         """Update the GUI display elements"""
+        # Nothing to redraw while the stick holds (nearly) still, e.g. idle or paused. Coming
+        # to rest is always drawn so the dot and labels settle exactly on center
+        jx, jy = self.joystick_x, self.joystick_y
+        shown = self.displayed_joystick
+        if shown == (jx, jy) or (shown and (jx or jy) and abs(jx - shown[0]) < DISPLAY_EPSILON
+                                 and abs(jy - shown[1]) < DISPLAY_EPSILON):
+            self.root.after(DISPLAY_INTERVAL_MS, self.update_display)
+            return
+        
         try:
-            x_pos = 90 + self.joystick_x * 80
-            y_pos = 90 - self.joystick_y * 80
-            
-            self.joystick_canvas.coords(self.joystick_dot, x_pos-5, y_pos-5, x_pos+5, y_pos+5)
+            x_pos = 90 + jx * 80
+            y_pos = 90 - jy * 80
             
-            self.x_label.config(text=f"X: {self.joystick_x:+.2f}")
-            self.y_label.config(text=f"Y: {self.joystick_y:+.2f}")
+            # Shift the dot by the change rather than resending its whole bounding box
+            old_x, old_y = self.dot_pos
+            self.joystick_canvas.move(self.joystick_dot, x_pos - old_x, y_pos - old_y)
+            self.dot_pos = (x_pos, y_pos)
             
-            magnitude = (self.joystick_x**2 + self.joystick_y**2)**0.5
-            if magnitude < 0.1:
-                color = '#0f0'
-            elif magnitude < 0.5:
-                color = '#ff0'
-            elif magnitude < 0.8:
-                color = '#f80'
-            else:
-                color = '#f00'
+            # Labels only change when their rounded text does
+            x_text = f"X: {jx:+.2f}"
+            if x_text != self.x_label_text:
+                self.x_label.config(text=x_text)
+                self.x_label_text = x_text
+            y_text = f"Y: {jy:+.2f}"
+            if y_text != self.y_label_text:
+                self.y_label.config(text=y_text)
+                self.y_label_text = y_text
             
-            self.joystick_canvas.itemconfig(self.joystick_dot, fill=color)
+            # Bucket by squared magnitude: the number of thresholds crossed is the colour index
+            magnitude_sq = jx * jx + jy * jy
+            color = DOT_COLORS[(magnitude_sq >= 0.01) + (magnitude_sq >= 0.25) + (magnitude_sq >= 0.64)]
             
-            if hasattr(self, 'sens_value'):
-                self.sens_value.config(text=f"{self.sensitivity.get():.0f}")
-            if hasattr(self, 'decay_value'):
-                self.decay_value.config(text=f"{self.decay_rate.get():.2f}")
-            if hasattr(self, 'dead_value'):
-                self.dead_value.config(text=f"{self.deadzone.get():.2f}")
-            if hasattr(self, 'smooth_value'):
-                self.smooth_value.config(text=f"{self.smoothing.get():.2f}")
+            if color != self.dot_color:
+                self.joystick_canvas.itemconfig(self.joystick_dot, fill=color)
+                self.dot_color = color
             
-            if hasattr(self, 'curve_canvas'):
-                self.draw_curve()
-                
+            self.displayed_joystick = (jx, jy)
         except (AttributeError, tk.TclError):
             pass
         
-        self.root.after(16, self.update_display)
+        self.root.after(DISPLAY_INTERVAL_MS, self.update_display)
     
     def on_closing(self):
-        # restore original window proc if we changed it
+        # stop the raw input message loop
         try:
-            if self.original_wndproc:
-                # Restore original WNDPROC
-                GWL_WNDPROC = -4
-                SetWindowLongPtrW = ctypes.windll.user32.SetWindowLongPtrW
-                SetWindowLongPtrW.restype = ctypes.c_void_p
-                SetWindowLongPtrW.argtypes = [wintypes.HWND, ctypes.c_int, ctypes.c_void_p]
-                SetWindowLongPtrW(self.hwnd, GWL_WNDPROC, self.original_wndproc)
-                self.original_wndproc = None
-                self.new_wndproc = None
-                self._wndproc_ref = None
-                print("Restored original window procedure")
+            if self.raw_input_thread_id:
+                ctypes.windll.user32.PostThreadMessageW(self.raw_input_thread_id, WM_QUIT, 0, 0)
+                self.raw_input_thread.join(1.0)
+                print("Stopped raw input thread")
         except Exception as e:
-            print(f"Error restoring window proc: {e}")
+            print(f"Error stopping raw input thread: {e}")
         
+        # stop_control already sent the neutral report
         if self.running:
             self.stop_control()
-        self.save_settings()
-        try:
-            self.gamepad.reset()
-        except Exception:
-            pass
+        # Write synchronously; a daemon writer thread would die with the process. That
+        # covers any changes the auto-save timer has not picked up yet
+        self.settings_dirty = False
+        self.save_settings(background=False)
         self.root.destroy()
 
 def main():
-    try:
-        import scipy
-    except ImportError:
-        print("Please install scipy: pip install scipy")
-        input("Press Enter to exit...")
-        return
-    
     root = tk.Tk()
     app = MouseToGamepadGUI(root)
     root.protocol("WM_DELETE_WINDOW", app.on_closing)